@@ -98,8 +98,15 @@ run_experiment() {
     
     # Extract statistics from client output
     if [ -f /tmp/client_output_${timestamp}.txt ]; then
-        throughput=$(grep "Throughput:" /tmp/client_output_${timestamp}.txt | tail -1 | awk '{print $2}')
-        latency=$(grep "Average Latency:" /tmp/client_output_${timestamp}.txt | tail -1 | awk '{print $3}')
+        # Stream the output once, keeping the last reported value of each;
+        # a missing value defaults to 0.0 so the two fields never shift
+        read -r throughput latency < <(
+            awk '
+                /Throughput:/      { tp = $2 }
+                /Average Latency:/ { lat = $3 }
+                END                { print (tp == "" ? "0.0" : tp), (lat == "" ? "0.0" : lat) }
+            ' /tmp/client_output_${timestamp}.txt
+        )
     else
         throughput="0.0"
         latency="0.0"
@@ -113,11 +120,27 @@ run_experiment() {
     ctx_switches="0"
     
     if [ -f "$perf_client" ]; then
-        cycles=$(grep "cycles" "$perf_client" | head -1 | awk '{print $1}' | tr -d ',')
-        cache_misses=$(grep "cache-misses" "$perf_client" | head -1 | awk '{print $1}' | tr -d ',')
-        l1_misses=$(grep "L1-dcache-load-misses" "$perf_client" | head -1 | awk '{print $1}' | tr -d ',')
-        llc_misses=$(grep "LLC-load-misses" "$perf_client" | head -1 | awk '{print $1}' | tr -d ',')
-        ctx_switches=$(grep "context-switches" "$perf_client" | head -1 | awk '{print $1}' | tr -d ',')
+        # Single pass over the perf output: first counted value for each event
+        read -r cycles cache_misses l1_misses llc_misses ctx_switches < <(
+            awk '
+                $1 ~ /^[0-9][0-9,.]*$/ {     # skip <not counted>/<not supported>
+                    event = $2
+                    sub(/^[^\/]*\//, "", event)  # hybrid CPUs: cpu_core/cycles/ -> cycles/
+                    sub(/\/.*$/, "", event)
+                    sub(/:.*/, "", event)       # drop modifiers such as cycles:u
+                    if (!(event in val)) {
+                        v = $1
+                        gsub(/,/, "", v)
+                        val[event] = v
+                    }
+                }
+                END {
+                    n = split("cycles cache-misses L1-dcache-load-misses LLC-load-misses context-switches", ev, " ")
+                    for (i = 1; i <= n; i++)
+                        printf "%s%s", ((ev[i] in val) ? val[ev[i]] : "0"), (i < n ? " " : "\n")
+                }
+            ' "$perf_client"
+        )
     fi
     
     # Write CSV header if file doesn't exist
@@ -170,11 +193,11 @@ echo ""
 combined_csv="${CSV_DIR}/combined_results.csv"
 echo "mode,msg_size,threads,throughput_gbps,latency_us,cycles,cache_misses,l1_misses,llc_misses,context_switches,timestamp" > "$combined_csv"
 
-for file in ${CSV_DIR}/run_*.csv; do
-    if [ -f "$file" ]; then
-        tail -n +2 "$file" >> "$combined_csv"
-    fi
-done
+# Expand the run files once and strip every header in a single awk process
+run_csvs=("${CSV_DIR}"/run_*.csv)
+if [ -f "${run_csvs[0]}" ]; then
+    awk 'FNR > 1' "${run_csvs[@]}" >> "$combined_csv"
+fi
 
 echo -e "${GREEN}Combined results saved to $combined_csv${NC}"
 echo ""
@@ -14,6 +14,9 @@ This script generates 4 required plots:
 4. CPU Cycles per Byte Transferred
 """
 
+import logging
+import matplotlib
+matplotlib.use('Agg', force=True)  # PDF output only; skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
 import sys
@@ -26,6 +29,11 @@ RAM: 8GB
 Date: 2026-02-07
 """
 
+# Annotation text and box style shared by every plot
+SYSTEM_CONFIG_TEXT = SYSTEM_CONFIG.strip()
+SYSTEM_CONFIG_ONELINE = SYSTEM_CONFIG_TEXT.replace('\n', ' | ')
+CONFIG_BBOX = dict(boxstyle='round', facecolor='wheat', alpha=0.5)
+
 # ============================================================================
 # HARDCODED EXPERIMENTAL DATA
 # ============================================================================
@@ -89,9 +97,84 @@ cycles_zero_copy = [40543575711, 44227911279, 42751881102, 30188950831]
 # ============================================================================
 # CALCULATED DATA: Bytes transferred = (throughput_gbps * DURATION * 1e9) / 8
 # ============================================================================
-bytes_two_copy = [(t * DURATION * 1e9) / 8 for t in throughput_two_copy_by_msgsize]
-bytes_one_copy = [(t * DURATION * 1e9) / 8 for t in throughput_one_copy_by_msgsize]
-bytes_zero_copy = [(t * DURATION * 1e9) / 8 for t in throughput_zero_copy_by_msgsize]
+bytes_two_copy = np.asarray(throughput_two_copy_by_msgsize) * (DURATION * 1e9 / 8)
+bytes_one_copy = np.asarray(throughput_one_copy_by_msgsize) * (DURATION * 1e9 / 8)
+bytes_zero_copy = np.asarray(throughput_zero_copy_by_msgsize) * (DURATION * 1e9 / 8)
+
+# Stacked per-mode arrays (rows: two-copy, one-copy, zero-copy)
+THROUGHPUT = np.stack([throughput_two_copy_by_msgsize,
+                       throughput_one_copy_by_msgsize,
+                       throughput_zero_copy_by_msgsize])
+LATENCY = np.stack([latency_two_copy_by_threads,
+                    latency_one_copy_by_threads,
+                    latency_zero_copy_by_threads])
+CYCLES = np.stack([cycles_two_copy, cycles_one_copy, cycles_zero_copy]).astype(float)
+BYTES = np.stack([bytes_two_copy, bytes_one_copy, bytes_zero_copy])
+CYCLES_PER_BYTE = CYCLES / BYTES
+
+# Cache misses in millions, divided once at load time
+L1_MISSES_M = np.array([l1_misses_two_copy, l1_misses_one_copy, l1_misses_zero_copy]) / 1e6
+CACHE_MISSES_M = np.array([cache_misses_two_copy, cache_misses_one_copy, cache_misses_zero_copy]) / 1e6
+LLC_MISSES_M = np.array([llc_misses_two_copy, llc_misses_one_copy, llc_misses_zero_copy]) / 1e6
+
+# Per-mode line styling, in the same row order as the stacked arrays
+MODE_LABELS = ['Two-Copy', 'One-Copy', 'Zero-Copy']
+MODE_COLORS = ['#e74c3c', '#3498db', '#2ecc71']
+MODE_MARKERS = ['o', 's', '^']
+
+# Fixed tick labels for the log2 message-size axes
+MSG_SIZE_LABELS = [str(s) for s in MSG_SIZES]
+
+# ============================================================================
+# PLOT SPECIFICATIONS
+# ============================================================================
+# One entry per output PDF. Each panel draws the three mode rows of 'ys'
+# against 'x'; single-panel plots get the config box inside the axes,
+# multi-panel plots get a suptitle and a one-line config strip below.
+
+PLOT_SPECS = [
+    {
+        'out': 'MT25048_Plot_Throughput_vs_MsgSize.pdf',
+        'panels': [{
+            'x': MSG_SIZES, 'ys': THROUGHPUT,
+            'labels': ['Two-Copy (send/recv)', 'One-Copy (sendmsg)', 'Zero-Copy (MSG_ZEROCOPY)'],
+            'xlabel': 'Message Size (bytes)', 'ylabel': 'Throughput (Gbps)',
+            'title': 'Throughput vs Message Size (4 threads)', 'xscale': 'log2',
+        }],
+    },
+    {
+        'out': 'MT25048_Plot_Latency_vs_Threads.pdf',
+        'panels': [{
+            'x': THREAD_COUNTS, 'ys': LATENCY,
+            'xlabel': 'Thread Count', 'ylabel': 'Average Latency (µs)',
+            'title': 'Latency vs Thread Count (1024-byte messages)', 'xscale': 'linear',
+        }],
+    },
+    {
+        'out': 'MT25048_Plot_CacheMisses_vs_MsgSize.pdf',
+        'suptitle': 'Cache Misses vs Message Size (4 threads)',
+        'panels': [
+            {'x': MSG_SIZES, 'ys': L1_MISSES_M,
+             'xlabel': 'Message Size (bytes)', 'ylabel': 'Misses (Millions)',
+             'title': 'L1 Data Cache Misses', 'xscale': 'log2'},
+            # perf cache-misses: misses that went to main memory
+            {'x': MSG_SIZES, 'ys': CACHE_MISSES_M,
+             'xlabel': 'Message Size (bytes)', 'ylabel': 'Misses (Millions)',
+             'title': 'Cache-to-Memory Misses', 'xscale': 'log2'},
+            {'x': MSG_SIZES, 'ys': LLC_MISSES_M,
+             'xlabel': 'Message Size (bytes)', 'ylabel': 'Misses (Millions)',
+             'title': 'LLC Load Misses', 'xscale': 'log2'},
+        ],
+    },
+    {
+        'out': 'MT25048_Plot_CyclesPerByte.pdf',
+        'panels': [{
+            'x': MSG_SIZES, 'ys': CYCLES_PER_BYTE,
+            'xlabel': 'Message Size (bytes)', 'ylabel': 'CPU Cycles per Byte',
+            'title': 'CPU Cycles per Byte Transferred (4 threads)', 'xscale': 'log2',
+        }],
+    },
+]
 
 # ============================================================================
 # PLOTTING FUNCTIONS
@@ -106,139 +189,76 @@ def setup_plot_style():
     plt.rcParams['legend.fontsize'] = 10
     plt.rcParams['lines.linewidth'] = 2
     plt.rcParams['lines.markersize'] = 8
+    plt.rcParams['figure.constrained_layout.use'] = True
+    # Keep text layout cheap: no TeX, plain mathtext, and the PDF core 14
+    # fonts, which are referenced by name instead of subset and embedded
+    plt.rcParams.update({
+        'text.usetex': False,
+        'mathtext.default': 'regular',
+        'pdf.use14corefonts': True,
+        'axes.unicode_minus': False,
+    })
+    # The core-14 AFMs declare their regular faces as weight 500, so every
+    # normal-weight text lookup logs a harmless weight-fallback warning
+    logging.getLogger('matplotlib.font_manager').setLevel(logging.ERROR)
 
-def plot_throughput_vs_msgsize():
-    """Plot 1: Throughput vs Message Size."""
-    plt.figure()
-    
-    plt.plot(MSG_SIZES, throughput_two_copy_by_msgsize, 'o-', label='Two-Copy (send/recv)', color='#e74c3c')
-    plt.plot(MSG_SIZES, throughput_one_copy_by_msgsize, 's-', label='One-Copy (sendmsg)', color='#3498db')
-    plt.plot(MSG_SIZES, throughput_zero_copy_by_msgsize, '^-', label='Zero-Copy (MSG_ZEROCOPY)', color='#2ecc71')
-    
-    plt.xlabel('Message Size (bytes)')
-    plt.ylabel('Throughput (Gbps)')
-    plt.title('Throughput vs Message Size (4 threads)')
-    plt.xscale('log', base=2)
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    
-    # Add system config annotation
-    plt.text(0.02, 0.98, SYSTEM_CONFIG.strip(), 
-             transform=plt.gca().transAxes, 
-             fontsize=8, 
-             verticalalignment='top',
-             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-    
-    plt.tight_layout()
-    plt.savefig('MT25048_Plot_Throughput_vs_MsgSize.pdf')
-    print("Saved: MT25048_Plot_Throughput_vs_MsgSize.pdf")
-    plt.close()
-
-def plot_latency_vs_threads():
-    """Plot 2: Latency vs Thread Count."""
-    plt.figure()
-    
-    plt.plot(THREAD_COUNTS, latency_two_copy_by_threads, 'o-', label='Two-Copy', color='#e74c3c')
-    plt.plot(THREAD_COUNTS, latency_one_copy_by_threads, 's-', label='One-Copy', color='#3498db')
-    plt.plot(THREAD_COUNTS, latency_zero_copy_by_threads, '^-', label='Zero-Copy', color='#2ecc71')
-    
-    plt.xlabel('Thread Count')
-    plt.ylabel('Average Latency (µs)')
-    plt.title('Latency vs Thread Count (1024-byte messages)')
-    plt.grid(True, alpha=0.3)
-    plt.legend()
-    plt.xticks(THREAD_COUNTS)
-    
-    plt.text(0.02, 0.98, SYSTEM_CONFIG.strip(), 
-             transform=plt.gca().transAxes, 
-             fontsize=8, 
-             verticalalignment='top',
-             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-    
-    plt.tight_layout()
-    plt.savefig('MT25048_Plot_Latency_vs_Threads.pdf')
-    print("Saved: MT25048_Plot_Latency_vs_Threads.pdf")
-    plt.close()
-
-def plot_cache_misses_vs_msgsize():
-    """Plot 3: Cache Misses vs Message Size."""
-    fig, axes = plt.subplots(1, 3, figsize=(15, 5))
-    
-    # Plot 1: L1 Data Cache Misses
-    axes[0].plot(MSG_SIZES, [v/1e6 for v in l1_misses_two_copy], 'o-', label='Two-Copy', color='#e74c3c')
-    axes[0].plot(MSG_SIZES, [v/1e6 for v in l1_misses_one_copy], 's-', label='One-Copy', color='#3498db')
-    axes[0].plot(MSG_SIZES, [v/1e6 for v in l1_misses_zero_copy], '^-', label='Zero-Copy', color='#2ecc71')
-    axes[0].set_xlabel('Message Size (bytes)')
-    axes[0].set_ylabel('Misses (Millions)')
-    axes[0].set_title('L1 Data Cache Misses')
-    axes[0].set_xscale('log', base=2)
-    axes[0].grid(True, alpha=0.3)
-    axes[0].legend()
-    
-    # Plot 2: Cache misses to memory (perf cache-misses)
-    axes[1].plot(MSG_SIZES, [v/1e6 for v in cache_misses_two_copy], 'o-', label='Two-Copy', color='#e74c3c')
-    axes[1].plot(MSG_SIZES, [v/1e6 for v in cache_misses_one_copy], 's-', label='One-Copy', color='#3498db')
-    axes[1].plot(MSG_SIZES, [v/1e6 for v in cache_misses_zero_copy], '^-', label='Zero-Copy', color='#2ecc71')
-    axes[1].set_xlabel('Message Size (bytes)')
-    axes[1].set_ylabel('Misses (Millions)')
-    axes[1].set_title('Cache-to-Memory Misses')
-    axes[1].set_xscale('log', base=2)
-    axes[1].grid(True, alpha=0.3)
-    axes[1].legend()
-    
-    # Plot 3: LLC Load Misses
-    axes[2].plot(MSG_SIZES, [v/1e6 for v in llc_misses_two_copy], 'o-', label='Two-Copy', color='#e74c3c')
-    axes[2].plot(MSG_SIZES, [v/1e6 for v in llc_misses_one_copy], 's-', label='One-Copy', color='#3498db')
-    axes[2].plot(MSG_SIZES, [v/1e6 for v in llc_misses_zero_copy], '^-', label='Zero-Copy', color='#2ecc71')
-    axes[2].set_xlabel('Message Size (bytes)')
-    axes[2].set_ylabel('Misses (Millions)')
-    axes[2].set_title('LLC Load Misses')
-    axes[2].set_xscale('log', base=2)
-    axes[2].grid(True, alpha=0.3)
-    axes[2].legend()
-    
-    plt.suptitle('Cache Misses vs Message Size (4 threads)')
-    
-    # Add system config annotation (centered at the bottom)
-    fig.text(0.5, 0.02, SYSTEM_CONFIG.strip().replace('\n', ' | '), 
-             ha='center', fontsize=9, 
-             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-    
-    plt.tight_layout(rect=[0, 0.05, 1, 0.95]) # Adjust layout to make room for suptitle and config
-    plt.savefig('MT25048_Plot_CacheMisses_vs_MsgSize.pdf')
-    print("Saved: MT25048_Plot_CacheMisses_vs_MsgSize.pdf")
-    plt.close()
-
-def plot_cycles_per_byte():
-    """Plot 4: CPU Cycles per Byte Transferred."""
-    # Calculate cycles per byte
-    cycles_per_byte_two = [cycles_two_copy[i] / bytes_two_copy[i] for i in range(len(MSG_SIZES))]
-    cycles_per_byte_one = [cycles_one_copy[i] / bytes_one_copy[i] for i in range(len(MSG_SIZES))]
-    cycles_per_byte_zero = [cycles_zero_copy[i] / bytes_zero_copy[i] for i in range(len(MSG_SIZES))]
-    
-    plt.figure()
+def style_log2_x(ax):
+    """Log2 message-size x axis with fixed ticks at the tested sizes."""
+    ax.set_xscale('log', base=2)
+    ax.grid(True, alpha=0.3)
+    ax.set_xticks(MSG_SIZES)
+    ax.set_xticklabels(MSG_SIZE_LABELS)
+
+def plot_modes(ax, x, Y, labels=MODE_LABELS):
+    """Draw one line per mode (columns of Y) with a single plot call."""
+    lines = ax.plot(x, Y)
+    for ln, lbl, c, m in zip(lines, labels, MODE_COLORS, MODE_MARKERS):
+        ln.set_label(lbl)
+        ln.set_color(c)
+        ln.set_marker(m)
+    return lines
+
+def draw_panel(ax, panel):
+    """Draw one axes from a panel spec (see PLOT_SPECS)."""
+    ax.clear()
     
-    plt.plot(MSG_SIZES, cycles_per_byte_two, 'o-', label='Two-Copy', color='#e74c3c')
-    plt.plot(MSG_SIZES, cycles_per_byte_one, 's-', label='One-Copy', color='#3498db')
-    plt.plot(MSG_SIZES, cycles_per_byte_zero, '^-', label='Zero-Copy', color='#2ecc71')
+    plot_modes(ax, panel['x'], panel['ys'].T, labels=panel.get('labels', MODE_LABELS))
     
-    plt.xlabel('Message Size (bytes)')
-    plt.ylabel('CPU Cycles per Byte')
-    plt.title('CPU Cycles per Byte Transferred (4 threads)')
-    plt.xscale('log', base=2)
-    plt.grid(True, alpha=0.3)
-    plt.legend()
+    ax.set_xlabel(panel['xlabel'])
+    ax.set_ylabel(panel['ylabel'])
+    ax.set_title(panel['title'])
+    if panel['xscale'] == 'log2':
+        style_log2_x(ax)
+    else:
+        ax.grid(True, alpha=0.3)
+        ax.set_xticks(panel['x'])
+    ax.legend()
+
+def render_plot(fig, axes, spec):
+    """Draw every panel of a plot spec, annotate it and save the PDF."""
+    for ax, panel in zip(axes, spec['panels']):
+        draw_panel(ax, panel)
     
-    plt.text(0.02, 0.98, SYSTEM_CONFIG.strip(), 
-             transform=plt.gca().transAxes, 
-             fontsize=8, 
-             verticalalignment='top',
-             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+    if len(axes) == 1:
+        # Add system config annotation
+        axes[0].text(0.02, 0.98, SYSTEM_CONFIG_TEXT, 
+                     transform=axes[0].transAxes, 
+                     fontsize=8, 
+                     verticalalignment='top',
+                     bbox=CONFIG_BBOX)
+    else:
+        fig.suptitle(spec['suptitle'])
+        
+        # Add system config annotation (centered at the bottom)
+        fig.text(0.5, 0.02, SYSTEM_CONFIG_ONELINE, 
+                 ha='center', fontsize=9, 
+                 bbox=CONFIG_BBOX)
+        
+        # Keep the bottom strip free for the config text (rect is left, bottom, width, height)
+        fig.get_layout_engine().set(rect=(0, 0.05, 1, 0.95))
     
-    plt.tight_layout()
-    plt.savefig('MT25048_Plot_CyclesPerByte.pdf')
-    print("Saved: MT25048_Plot_CyclesPerByte.pdf")
-    plt.close()
+    fig.savefig(spec['out'])
+    print(f"Saved: {spec['out']}")
 
 # ============================================================================
 # MAIN FUNCTION
@@ -258,10 +278,14 @@ def main():
     setup_plot_style()
     
     print("Generating plots...")
-    plot_throughput_vs_msgsize()
-    plot_latency_vs_threads()
-    plot_cache_misses_vs_msgsize()
-    plot_cycles_per_byte()
+    # One persistent figure per panel count: the single-panel plots share
+    # one Figure/Axes, the 3-panel cache plot gets its own
+    fig, ax = plt.subplots()
+    fig3, axes3 = plt.subplots(1, 3, figsize=(15, 5))
+    figures = {1: (fig, [ax]), 3: (fig3, axes3)}
+    for spec in PLOT_SPECS:
+        render_plot(*figures[len(spec['panels'])], spec)
+    plt.close('all')
     
     print()
     print("="*60)
@@ -269,10 +293,8 @@ def main():
     print("="*60)
     print()
     print("Files created:")
-    print("  - MT25048_Plot_Throughput_vs_MsgSize.pdf")
-    print("  - MT25048_Plot_Latency_vs_Threads.pdf")
-    print("  - MT25048_Plot_CacheMisses_vs_MsgSize.pdf")
-    print("  - MT25048_Plot_CyclesPerByte.pdf")
+    for spec in PLOT_SPECS:
+        print(f"  - {spec['out']}")
     print()
     print("Next steps:")
     print("  1. Embed these plots in your report PDF")